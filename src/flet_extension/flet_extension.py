@@ -1,4 +1,5 @@
-from dataclasses import field
+import asyncio
+import logging
 from typing import Optional, Any, Callable, Union, List
 
 import flet as ft
@@ -6,6 +7,26 @@ from flet import AnimationValue, Animation, AnimationCurve, Duration, DurationVa
 
 __all__ = ["FletExtension"]
 
+logger = logging.getLogger(__name__)
+
+_VALID_ANIMATION_TYPES = frozenset(("fade", "scale", "slide", "rotate"))
+
+# Content properties accepted by update_content, in payload order
+_CONTENT_FIELDS = ("src", "title", "subtitle")
+
+# Values applied in __init__ when the corresponding argument is None
+_DEFAULTS = {
+    "border_radius": 8.0,
+    "border_width": 0.0,
+    "padding": 16.0,
+    "margin": 0.0,
+    "animation_duration": 1.0,
+    "animation_curve": AnimationCurve.EASE_IN_OUT,
+    "clickable": True,
+    "elevation": 2.0,
+    "opacity": 1.0,
+}
+
 
 @ft.control("FletExtension")
 class FletExtension(ft.ConstrainedControl):
@@ -94,47 +115,67 @@ class FletExtension(ft.ConstrainedControl):
         """
         super().__init__(**kwargs)
         
-        self.src = src
-        self.title = title
-        self.subtitle = subtitle
-        self.background_color = background_color
-        self.text_color = text_color
-        self.border_radius = border_radius if border_radius is not None else 8.0
-        self.border_width = border_width if border_width is not None else 0.0
-        self.border_color = border_color
-        self.padding = padding if padding is not None else 16.0
-        self.margin = margin if margin is not None else 0.0
-        self.animation_type = animation_type
-        self.animation_duration = animation_duration if animation_duration is not None else 1.0
-        self.animation_curve = animation_curve if animation_curve is not None else AnimationCurve.EASE_IN_OUT
-        self.clickable = clickable if clickable is not None else True
-        self.elevation = elevation if elevation is not None else 2.0
-        self.opacity = opacity if opacity is not None else 1.0
-        self.on_click = on_click
-        self.on_hover = on_hover
-        self.on_animation_complete = on_animation_complete
+        vals = {
+            "src": src,
+            "title": title,
+            "subtitle": subtitle,
+            "background_color": background_color,
+            "text_color": text_color,
+            "border_radius": border_radius,
+            "border_width": border_width,
+            "border_color": border_color,
+            "padding": padding,
+            "margin": margin,
+            "animation_type": animation_type,
+            "animation_duration": animation_duration,
+            "animation_curve": animation_curve,
+            "clickable": clickable,
+            "elevation": elevation,
+            "opacity": opacity,
+            "on_click": on_click,
+            "on_hover": on_hover,
+            "on_animation_complete": on_animation_complete,
+        }
+        for k, v in vals.items():
+            setattr(self, k, _DEFAULTS[k] if v is None and k in _DEFAULTS else v)
         
         # Initialize animation properties
         self.animation = None
         self.custom_animation = None
         self.font_size = 14.0
 
+        # Last default animation built, keyed on (duration, curve)
+        self._anim_cache_key = None
+        self._anim_cache_val = None
+
+        # Content deltas coalesced into a single update_content call
+        self._pending_content = {}
+        self._content_waiters = []
+        self._flush_scheduled = False
+
+        # Strong references to tasks scheduled by the sync methods
+        self._background_tasks = set()
+
+    # Note: __slots__ is intentionally not used. ft.ConstrainedControl
+    # instances already carry a __dict__, and slot descriptors would
+    # clash with the dataclass field defaults declared below.
+
     # Content properties
-    src: Optional[str] = field(default=None)
+    src: Optional[str] = None
     """Primary content text to display in the extension.
     
     This is the main text content that will be prominently displayed.
     Supports plain text and can be updated dynamically.
     """
     
-    title: Optional[str] = field(default=None)
+    title: Optional[str] = None
     """Title text displayed at the top of the extension.
     
     Used for headings or primary labels. Typically rendered with
     larger font size and bold styling.
     """
     
-    subtitle: Optional[str] = field(default=None)
+    subtitle: Optional[str] = None
     """Subtitle text displayed at the bottom of the extension.
     
     Used for secondary information, descriptions, or status text.
@@ -142,35 +183,35 @@ class FletExtension(ft.ConstrainedControl):
     """
     
     # Visual properties
-    background_color: Optional[str] = field(default=None)
+    background_color: Optional[str] = None
     """Background color of the extension container.
     
     Accepts hex colors (#RRGGBB), named colors (red, blue), or CSS colors.
     Example: '#e3f2fd', 'lightblue', 'rgba(227, 242, 253, 0.8)'
     """
     
-    text_color: Optional[str] = field(default=None)
+    text_color: Optional[str] = None
     """Color of all text elements in the extension.
     
     Applied to title, src, and subtitle text. Accepts same formats
     as background_color. Defaults to theme text color if not specified.
     """
     
-    border_color: Optional[str] = field(default=None)
+    border_color: Optional[str] = None
     """Color of the border.
     
     Only visible when border_width > 0. Accepts same color formats
     as background_color.
     """
     
-    border_width: Optional[float] = field(default=0.0)
+    border_width: Optional[float] = 0.0
     """Width of the border line in logical pixels.
     
     Set to 0 for no border. Typical values range from 1-4 pixels.
     Requires border_color to be visible.
     """
     
-    border_radius: Optional[float] = field(default=8.0)
+    border_radius: Optional[float] = 8.0
     """Corner radius for rounded borders in logical pixels.
     
     Controls how rounded the corners appear. Common values:
@@ -181,21 +222,21 @@ class FletExtension(ft.ConstrainedControl):
     """
     
     # Size and spacing
-    font_size: Optional[float] = field(default=14.0)
+    font_size: Optional[float] = 14.0
     """Font size for text elements in logical pixels.
     
     Applied to the main src text. Title and subtitle may use
     proportionally larger/smaller sizes based on this value.
     """
     
-    padding: Optional[float] = field(default=16.0)
+    padding: Optional[float] = 16.0
     """Internal spacing around the content in logical pixels.
     
     Can be a single number for uniform padding, or ft.Padding object
     for different values per side.
     """
     
-    margin: Optional[float] = field(default=0.0)
+    margin: Optional[float] = 0.0
     """External spacing around the control in logical pixels.
     
     Can be a single number for uniform margin, or ft.Margin object
@@ -203,14 +244,14 @@ class FletExtension(ft.ConstrainedControl):
     """
     
     # Animation properties
-    animation_duration: Optional[float] = field(default=1.0)
+    animation_duration: Optional[float] = 1.0
     """Duration of animations in seconds.
     
     Can be a float for seconds. Typical values: 0.2-0.5 for quick animations, 
     1.0-2.0 for slower effects. Used when triggering animations programmatically.
     """
     
-    animation_type: Optional[str] = field(default=None)
+    animation_type: Optional[str] = None
     """Type of animation to apply when triggered.
     
     Supported animation types:
@@ -222,21 +263,21 @@ class FletExtension(ft.ConstrainedControl):
     Use trigger_animation() or trigger_animation_async() to start animations.
     """
     
-    animation: Optional[AnimationValue] = field(default=None)
+    animation: Optional[AnimationValue] = None
     """Flet native animation configuration using AnimationValue.
     
     For advanced animation control. If specified, overrides
     animation_duration and animation_curve settings.
     """
     
-    custom_animation: Optional[AnimationValue] = field(default=None)
+    custom_animation: Optional[AnimationValue] = None
     """Custom animation configuration using Flet's Animation class.
     
     Can be used alongside the main animation for layered effects.
     Allows fine-grained control over animation timing and curves.
     """
     
-    animation_curve: Optional[AnimationCurve] = field(default=AnimationCurve.EASE_IN_OUT)
+    animation_curve: Optional[AnimationCurve] = AnimationCurve.EASE_IN_OUT
     """Animation easing curve for smooth transitions.
     
     Common curves:
@@ -248,7 +289,7 @@ class FletExtension(ft.ConstrainedControl):
     """
     
     # Interactive properties
-    clickable: Optional[bool] = field(default=True)
+    clickable: Optional[bool] = True
     """Whether the extension responds to click events.
     
     When True, the control will:
@@ -257,7 +298,7 @@ class FletExtension(ft.ConstrainedControl):
     - Display appropriate cursor on hover
     """
     
-    elevation: Optional[float] = field(default=2.0)
+    elevation: Optional[float] = 2.0
     """Material Design shadow elevation (0-24).
     
     Controls the depth appearance of the control:
@@ -267,7 +308,7 @@ class FletExtension(ft.ConstrainedControl):
     - 16-24: Strong shadow (use sparingly)
     """
     
-    opacity: Optional[float] = field(default=1.0)
+    opacity: Optional[float] = 1.0
     """Transparency level of the entire control (0.0 to 1.0).
     
     - 0.0: Completely transparent (invisible)
@@ -278,7 +319,7 @@ class FletExtension(ft.ConstrainedControl):
     """
     
     # Event handlers
-    on_click: Optional[Callable[[ft.ControlEvent], None]] = field(default=None)
+    on_click: Optional[Callable[[ft.ControlEvent], None]] = None
     """Callback function triggered when the control is clicked.
     
     Args:
@@ -295,7 +336,7 @@ class FletExtension(ft.ConstrainedControl):
         ```
     """
     
-    on_hover: Optional[Callable[[ft.ControlEvent], None]] = field(default=None)
+    on_hover: Optional[Callable[[ft.ControlEvent], None]] = None
     """Callback function triggered when mouse enters/exits the control.
     
     Args:
@@ -318,7 +359,7 @@ class FletExtension(ft.ConstrainedControl):
         ```
     """
     
-    on_animation_complete: Optional[Callable[[ft.ControlEvent], None]] = field(default=None)
+    on_animation_complete: Optional[Callable[[ft.ControlEvent], None]] = None
     """Callback function triggered when an animation finishes.
     
     Args:
@@ -338,6 +379,55 @@ class FletExtension(ft.ConstrainedControl):
         ```
     """
     
+    def _get_default_animation(self) -> Animation:
+        """
+        Return the default animation for the current duration and curve.
+
+        The Animation is rebuilt only when animation_duration or
+        animation_curve changed since the last call.
+        """
+        duration = self.animation_duration
+        curve = self.animation_curve
+        key = (duration, curve)
+        if self._anim_cache_key != key:
+            # __init__ guarantees a curve; fall back only if it was reset to None
+            self._anim_cache_val = Animation(
+                duration=Duration(milliseconds=int(duration * 1000)),
+                curve=curve or _DEFAULTS["animation_curve"],
+            )
+            self._anim_cache_key = key
+        return self._anim_cache_val
+
+    def _validate_animation_type(self, animation_type: str):
+        """
+        Raise ValueError if animation_type is not supported.
+        """
+        if animation_type not in _VALID_ANIMATION_TYPES:
+            raise ValueError(
+                f"Invalid animation_type '{animation_type}'. "
+                f"Must be one of: {sorted(_VALID_ANIMATION_TYPES)}"
+            )
+
+    def _prepare_trigger(
+        self, animation_type: str, custom_animation: Optional[AnimationValue]
+    ) -> dict:
+        """
+        Set custom_animation for a validated trigger request.
+
+        Shared by trigger_animation() and trigger_animation_async().
+
+        Returns:
+            The arguments for the trigger_animation method call.
+        """
+        # Use provided custom_animation or reuse the cached default
+        if custom_animation is None:
+            custom_animation = self._get_default_animation()
+
+        # Set the custom_animation property
+        self.custom_animation = custom_animation
+
+        return {"animation_type": animation_type}
+
     # Methods for triggering events from Python
     async def trigger_animation_async(self, animation_type: str = "fade", custom_animation: Optional[AnimationValue] = None):
         """
@@ -368,37 +458,22 @@ class FletExtension(ft.ConstrainedControl):
             await ext.trigger_animation_async("fade")
             ```
         """
-        valid_types = ["fade", "scale", "slide", "rotate"]
-        if animation_type not in valid_types:
-            raise ValueError(f"Invalid animation_type '{animation_type}'. Must be one of: {valid_types}")
-            
-        # Use provided custom_animation or create default
-        if custom_animation is None:
-            custom_animation = Animation(
-                duration=Duration(milliseconds=int(self.animation_duration * 1000)),
-                curve=self.animation_curve or AnimationCurve.EASE_IN_OUT
-            )
-        
-        # Set the custom_animation property
-        self.custom_animation = custom_animation
-        
+        self._validate_animation_type(animation_type)
+        arguments = self._prepare_trigger(animation_type, custom_animation)
         try:
-            return await self._invoke_method(
-                "trigger_animation",
-                {
-                    "animation_type": animation_type
-                }
-            )
+            return await self._invoke_method("trigger_animation", arguments)
         except Exception as e:
-            print(f"Debug: Failed to trigger animation '{animation_type}': {e}")
+            logger.debug("Failed to trigger animation %r: %s", animation_type, e)
             raise
     
     async def update_content_async(self, src: str = None, title: str = None, subtitle: str = None):
         """
         Update content dynamically and asynchronously.
         
-        This method updates the content properties and refreshes the control
-        to reflect the changes immediately.
+        Local properties are updated immediately. The call to Flutter is
+        deferred to the next event loop iteration and merged with any other
+        pending content updates; every merged caller receives the result of
+        that single update.
         
         Args:
             src: New main content text to display
@@ -418,29 +493,71 @@ class FletExtension(ft.ConstrainedControl):
             await ext.update_content_async(src="Just new content")
             ```
         """
+        if src is None and title is None and subtitle is None:
+            return None
+        loop = asyncio.get_running_loop()
+        self._queue_content(loop, src, title, subtitle)
+        waiter = loop.create_future()
+        self._content_waiters.append(waiter)
+        return await waiter
+
+    def _queue_content(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        src: str = None,
+        title: str = None,
+        subtitle: str = None,
+    ):
+        """
+        Update local properties and queue the changes for the Flutter side.
+
+        Calls made within the same event loop iteration are merged and
+        sent as a single update_content invocation.
+        """
         # Update local properties if provided
-        if src is not None:
-            self.src = str(src)
-        if title is not None:
-            self.title = str(title)
-        if subtitle is not None:
-            self.subtitle = str(subtitle)
-            
+        for name, value in zip(_CONTENT_FIELDS, (src, title, subtitle)):
+            if value is not None:
+                if type(value) is not str:
+                    value = str(value)
+                setattr(self, name, value)
+                self._pending_content[name] = value
+
+        if not self._flush_scheduled:
+            loop.call_soon(self._flush_content)
+            self._flush_scheduled = True
+
+    def _flush_content(self):
+        """Send all queued content changes in one task."""
+        payload, self._pending_content = self._pending_content, {}
+        waiters, self._content_waiters = self._content_waiters, []
+        self._flush_scheduled = False
+
+        self._spawn(asyncio.get_running_loop(), self._send_content(payload, waiters))
+
+    def _spawn(self, loop: asyncio.AbstractEventLoop, coro):
+        """Schedule a coroutine, keeping a reference until it finishes."""
+        task = loop.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def _send_content(self, payload: dict, waiters: list):
+        """Invoke update_content and resolve the awaiting callers."""
         try:
-            return await self._invoke_method(
-                "update_content",
-                {
-                    "src": src,
-                    "title": title,
-                    "subtitle": subtitle
-                }
-            )
+            result = await self._invoke_method("update_content", payload)
         except Exception as e:
-            print(f"Debug: Failed to update content: {e}")
-            raise
-    
+            if waiters:
+                logger.debug("Failed to update content: %s", e)
+            else:
+                # Only sync callers queued this update; nobody else will see it
+                logger.warning("Failed to update content", exc_info=e)
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_exception(e)
+            return
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(result)
 
-    
     def trigger_animation(self, animation_type: str = "fade", custom_animation: Optional[AnimationValue] = None):
         """
         Trigger an animation synchronously on the Flutter side.
@@ -458,6 +575,7 @@ class FletExtension(ft.ConstrainedControl):
                 
         Raises:
             ValueError: If animation_type is not supported
+            RuntimeError: If called without a running event loop
             
         Example:
             ```python
@@ -471,37 +589,35 @@ class FletExtension(ft.ConstrainedControl):
             ext.trigger_animation("scale")
             ```
         """
-        valid_types = ["fade", "scale", "slide", "rotate"]
-        if animation_type not in valid_types:
-            raise ValueError(f"Invalid animation_type '{animation_type}'. Must be one of: {valid_types}")
-            
-        # Use provided custom_animation or create default
-        if custom_animation is None:
-            custom_animation = Animation(
-                duration=Duration(milliseconds=int(self.animation_duration * 1000)),
-                curve=self.animation_curve or AnimationCurve.EASE_IN_OUT
-            )
-        
-        # Set the custom_animation property
-        self.custom_animation = custom_animation
-        
+        self._validate_animation_type(animation_type)
         try:
-            self._invoke_method(
-                "trigger_animation",
-                {
-                    "animation_type": animation_type
-                }
-            )
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            raise RuntimeError(
+                "trigger_animation() requires a running event loop; "
+                "call it from a Flet event handler or use trigger_animation_async()"
+            ) from None
+        arguments = self._prepare_trigger(animation_type, custom_animation)
+        self._spawn(loop, self._send_trigger(arguments))
+
+    async def _send_trigger(self, arguments: dict):
+        """Invoke trigger_animation on behalf of the sync method."""
+        try:
+            await self._invoke_method("trigger_animation", arguments)
         except Exception as e:
-            print(f"Debug: Failed to trigger animation '{animation_type}': {e}")
-            raise
+            logger.warning(
+                "Failed to trigger animation %r",
+                arguments["animation_type"],
+                exc_info=e,
+            )
     
     def update_content(self, src: str = None, title: str = None, subtitle: str = None):
         """
         Update content dynamically (sync version).
         
         This is the synchronous version of update_content_async().
-        The control will be updated immediately to reflect the changes.
+        Local properties are updated immediately; calls made within the same
+        event loop iteration are sent to Flutter as a single update.
         
         Args:
             src: New main content text to display (optional)
@@ -521,24 +637,17 @@ class FletExtension(ft.ConstrainedControl):
             # Update only main content
             ext.update_content(src="New content only")
             ```
+
+        Raises:
+            RuntimeError: If called without a running event loop
         """
-        # Update local properties if provided
-        if src is not None:
-            self.src = str(src)
-        if title is not None:
-            self.title = str(title)
-        if subtitle is not None:
-            self.subtitle = str(subtitle)
-            
+        if src is None and title is None and subtitle is None:
+            return None
         try:
-            self._invoke_method(
-                "update_content",
-                {
-                    "src": src,
-                    "title": title,
-                    "subtitle": subtitle
-                }
-            )
-        except Exception as e:
-            print(f"Debug: Failed to update content: {e}")
-            raise
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            raise RuntimeError(
+                "update_content() requires a running event loop; "
+                "call it from a Flet event handler or use update_content_async()"
+            ) from None
+        self._queue_content(loop, src, title, subtitle)
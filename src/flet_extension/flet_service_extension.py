@@ -1,4 +1,6 @@
 import asyncio
+import logging
+from collections.abc import Coroutine
 from dataclasses import field
 from typing import Any, Optional
 
@@ -6,6 +8,8 @@ import flet as ft
 
 __all__ = ["FletServiceExtension"]
 
+logger = logging.getLogger(__name__)
+
 
 @ft.control("FletServiceExtension")
 class FletServiceExtension(ft.Service):
@@ -26,17 +30,17 @@ class FletServiceExtension(ft.Service):
     """
 
     # Configuration properties
-    auto_start: bool = field(default=False)
+    auto_start: bool = False
     """
     Whether the service should start automatically when initialized.
     """
 
-    interval: float = field(default=1.0)
+    interval: float = 1.0
     """
     The interval in seconds for periodic operations.
     """
 
-    max_count: int = field(default=10)
+    max_count: int = 10
     """
     Maximum count for demonstration purposes.
     """
@@ -60,6 +64,28 @@ class FletServiceExtension(ft.Service):
     Event data contains: {"error": str, "code": int}
     """
 
+    # Keys accepted by set_configuration, in argument order
+    _CONFIG_KEYS = ("interval", "max_count")
+
+    # Coroutines queued by the synchronous wrappers, drained once per loop tick
+    _pending: list[Coroutine[Any, Any, Any]] = field(
+        default_factory=list,
+        init=False,
+        repr=False,
+        compare=False,
+        metadata={"skip": True},
+    )
+    _drain_scheduled: bool = field(
+        default=False, init=False, repr=False, compare=False, metadata={"skip": True}
+    )
+    _drain_tasks: set[asyncio.Task] = field(
+        default_factory=set,
+        init=False,
+        repr=False,
+        compare=False,
+        metadata={"skip": True},
+    )
+
     # Async methods for service control
     async def start_service_async(
         self, custom_interval: Optional[float] = None, timeout: Optional[float] = 10
@@ -161,11 +187,11 @@ class FletServiceExtension(ft.Service):
         Returns:
             True if configuration was updated successfully.
         """
-        config = {}
-        if interval is not None:
-            config["interval"] = interval
-        if max_count is not None:
-            config["max_count"] = max_count
+        config = {
+            k: v
+            for k, v in zip(self._CONFIG_KEYS, (interval, max_count))
+            if v is not None
+        }
 
         return await self._invoke_method(
             method_name="set_configuration", arguments=config, timeout=timeout
@@ -192,28 +218,92 @@ class FletServiceExtension(ft.Service):
         )
 
     # Synchronous convenience methods
+    def _enqueue(self, coro: Coroutine[Any, Any, Any]):
+        """
+        Queues a coroutine to run on the next event loop tick.
+
+        Back-to-back synchronous calls are coalesced into a single task.
+        When called off the event loop thread (e.g. from `page.run_thread`),
+        the coroutine is submitted to the page's event loop instead and its
+        result is returned once it completes.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return self._run_blocking(coro)
+
+        self._pending.append(coro)
+        if not self._drain_scheduled:
+            self._drain_scheduled = True
+            task = loop.create_task(self._drain())
+            self._drain_tasks.add(task)
+            task.add_done_callback(self._drain_tasks.discard)
+
+    def _run_blocking(self, coro: Coroutine[Any, Any, Any]) -> Any:
+        """
+        Runs a coroutine to completion from a thread without a running loop.
+        """
+        try:
+            loop = self.page.loop
+        except (RuntimeError, AttributeError):
+            # Not attached to a live page session; there is no loop to use
+            return asyncio.run(coro)
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    async def _drain(self):
+        """
+        Awaits all queued coroutines in order within a single task.
+        """
+        pending, self._pending = self._pending, []
+        self._drain_scheduled = False
+        for coro in pending:
+            try:
+                await coro
+            except Exception:
+                logger.warning("Queued service call failed", exc_info=True)
+
     def start_service(
         self, custom_interval: Optional[float] = None, timeout: Optional[float] = 10
     ):
         """
         Starts the service (synchronous version).
+
+        Returns:
+            The call's result when called off the event loop thread. On the
+            event loop the call is queued and None is returned; use the async
+            version to get the result.
         """
-        asyncio.create_task(self.start_service_async(custom_interval, timeout))
+        return self._enqueue(self.start_service_async(custom_interval, timeout))
 
     def stop_service(self, timeout: Optional[float] = 10):
         """
         Stops the service (synchronous version).
+
+        Returns:
+            The call's result when called off the event loop thread. On the
+            event loop the call is queued and None is returned; use the async
+            version to get the result.
         """
-        asyncio.create_task(self.stop_service_async(timeout))
+        return self._enqueue(self.stop_service_async(timeout))
 
     def pause_service(self, timeout: Optional[float] = 10):
         """
         Pauses the service (synchronous version).
+
+        Returns:
+            The call's result when called off the event loop thread. On the
+            event loop the call is queued and None is returned; use the async
+            version to get the result.
         """
-        asyncio.create_task(self.pause_service_async(timeout))
+        return self._enqueue(self.pause_service_async(timeout))
 
     def reset_counter(self, timeout: Optional[float] = 10):
         """
         Resets the counter (synchronous version).
+
+        Returns:
+            The call's result when called off the event loop thread. On the
+            event loop the call is queued and None is returned; use the async
+            version to get the result.
         """
-        asyncio.create_task(self.reset_counter_async(timeout))
+        return self._enqueue(self.reset_counter_async(timeout))